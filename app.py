@@ -1,13 +1,81 @@
 import streamlit as st
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import requests
 import os
 import json
-from sentiment_analysis import analyze_feed, analyze_uploaded_file
-from utils import build_sentiment_summary, make_clickable_link, parse_uploaded_file
+from sentiment_analysis import analyze_feed, analyze_uploaded_bytes
+from utils import build_sentiment_summary, parse_uploaded_file
+
+def _frame_signature(df: pd.DataFrame) -> tuple:
+    """Cache key for a results DataFrame: row count and a hash of every (date, label) row."""
+    rows = int(pd.util.hash_pandas_object(df[['date', 'textblob_sentiment']], index=False).sum())
+    return (len(df), rows)
+
+@st.cache_data
+def make_donut(summary: dict) -> go.Figure:
+    """Build the sentiment distribution donut chart."""
+    fig_donut = px.pie(
+        values=[summary['positive_count'], summary['negative_count'], summary['neutral_count']],
+        names=['Positive', 'Negative', 'Neutral'],
+        color_discrete_map={
+            'Positive': '#00ff00',
+            'Negative': '#ff0000',
+            'Neutral': '#808080'
+        },
+        hole=0.4
+    )
+    
+    fig_donut.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
+    )
+    
+    fig_donut.update_layout(
+        showlegend=True,
+        height=400,
+        margin=dict(t=50, b=50, l=50, r=50)
+    )
+    
+    return fig_donut
+
+@st.cache_data(hash_funcs={pd.DataFrame: _frame_signature})
+def make_trend(df: pd.DataFrame) -> go.Figure:
+    """Build the sentiment count over time line chart."""
+    # Convert date to datetime if it's not already
+    dates = df['date']
+    if not is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce', cache=True)
+    
+    # Group by calendar day (a datetime64[D] view, not per-row date objects) and sentiment
+    days = pd.Series(dates.values.astype('datetime64[D]'), index=df.index, name='date')
+    trend_data = df.groupby([days, 'textblob_sentiment']).size().reset_index(name='count')
+    
+    # Create line chart
+    fig_line = px.line(
+        trend_data,
+        x='date',
+        y='count',
+        color='textblob_sentiment',
+        color_discrete_map={
+            'Positive': '#00ff00',
+            'Negative': '#ff0000',
+            'Neutral': '#808080'
+        },
+        title="Sentiment Count Over Time"
+    )
+    
+    fig_line.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Article Count",
+        height=400,
+        margin=dict(t=50, b=50, l=50, r=50)
+    )
+    
+    return fig_line
 
 # Configure page
 st.set_page_config(
@@ -57,11 +125,8 @@ if analysis_type == "Live RSS Feed":
         if keyword.strip():
             with st.spinner(f"Fetching and analyzing news for '{keyword}'..."):
                 try:
-                    # Create requests session
-                    session = requests.Session()
-                    
                     # Analyze the feed
-                    results_df = analyze_feed(keyword, session)
+                    results_df = analyze_feed(keyword)
                     
                     if results_df is not None and not results_df.empty:
                         st.session_state.analysis_results = results_df
@@ -92,8 +157,8 @@ else:  # Upload File
         if uploaded_file is not None:
             with st.spinner("Processing uploaded file..."):
                 try:
-                    # Analyze the uploaded file
-                    results_df = analyze_uploaded_file(uploaded_file)
+                    # Analyze the uploaded file (cached on its contents)
+                    results_df = analyze_uploaded_bytes(uploaded_file.getvalue(), uploaded_file.name)
                     
                     if results_df is not None and not results_df.empty:
                         st.session_state.analysis_results = results_df
@@ -157,28 +222,7 @@ if st.session_state.analysis_results is not None:
         st.subheader("🍩 Sentiment Distribution")
         
         # Create donut chart
-        fig_donut = px.pie(
-            values=[summary['positive_count'], summary['negative_count'], summary['neutral_count']],
-            names=['Positive', 'Negative', 'Neutral'],
-            color_discrete_map={
-                'Positive': '#00ff00',
-                'Negative': '#ff0000',
-                'Neutral': '#808080'
-            },
-            hole=0.4
-        )
-        
-        fig_donut.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
-        )
-        
-        fig_donut.update_layout(
-            showlegend=True,
-            height=400,
-            margin=dict(t=50, b=50, l=50, r=50)
-        )
+        fig_donut = make_donut(summary)
         
         st.plotly_chart(fig_donut, use_container_width=True)
     
@@ -187,32 +231,8 @@ if st.session_state.analysis_results is not None:
         
         # Prepare trend data
         if 'date' in df.columns:
-            # Convert date to datetime if it's not already
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            
-            # Group by date and sentiment
-            trend_data = df.groupby([df['date'].dt.date, 'textblob_sentiment']).size().reset_index(name='count')
-            
             # Create line chart
-            fig_line = px.line(
-                trend_data,
-                x='date',
-                y='count',
-                color='textblob_sentiment',
-                color_discrete_map={
-                    'Positive': '#00ff00',
-                    'Negative': '#ff0000',
-                    'Neutral': '#808080'
-                },
-                title="Sentiment Count Over Time"
-            )
-            
-            fig_line.update_layout(
-                xaxis_title="Date",
-                yaxis_title="Article Count",
-                height=400,
-                margin=dict(t=50, b=50, l=50, r=50)
-            )
+            fig_line = make_trend(df)
             
             st.plotly_chart(fig_line, use_container_width=True)
         else:
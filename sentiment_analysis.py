@@ -1,141 +1,129 @@
+import numpy as np
 import pandas as pd
 import requests
-import feedparser
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+import html
+import io
+import logging
 import re
 import os
 
-# Initialize VADER analyzer
-vader_analyzer = SentimentIntensityAnalyzer()
+logger = logging.getLogger(__name__)
 
-def analyze_feed(keyword: str, session: requests.Session) -> pd.DataFrame:
+# Labels indexed by the int8 codes produced by _classify
+_SENTIMENT_LABELS = np.array(['Negative', 'Neutral', 'Positive'])
+_URGENCY_LABELS = np.array(['Low', 'Medium', 'High'])
+
+# Child tags read from generic XML <item>/<entry> elements
+_XML_ITEM_TAGS = frozenset({'title', 'summary', 'description', 'pubDate', 'published', 'link', 'source'})
+
+# RFC 822 date format used by RSS <pubDate> elements
+RSS_DATE_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
+
+# Texts shorter than this are scored by VADER only
+MIN_TEXTBLOB_LENGTH = 20
+
+# Pattern for stripping HTML tags from summaries
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+@st.cache_resource
+def get_vader():
+    """Return a shared VADER analyzer, loading its lexicon once per process."""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    
+    return SentimentIntensityAnalyzer()
+
+@st.cache_resource
+def _get_session() -> requests.Session:
+    """Create a pooled HTTP session with retries, shared across reruns."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    # Set up session with headers
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    
+    return session
+
+def analyze_feed(keyword) -> pd.DataFrame:
     """
-    Analyze sentiment from Google News RSS feed for a given keyword.
+    Analyze sentiment from Google News RSS feed for one or more keywords.
+    
+    Downloads and analysis results are cached for ten minutes, so repeated
+    searches for the same keyword skip the HTTP request and sentiment pass.
     
     Args:
-        keyword (str): The keyword to search for
-        session (requests.Session): HTTP session for making requests
+        keyword (str | list): The keyword, or list of keywords, to search for
         
     Returns:
         pd.DataFrame: DataFrame with sentiment analysis results
     """
     try:
-        # Construct Google News RSS URL
-        base_url = "https://news.google.com/rss/search"
-        params = {
-            'q': keyword,
-            'hl': 'en',
-            'gl': 'US',
-            'ceid': 'US:en'
-        }
+        keywords = [keyword] if isinstance(keyword, str) else list(keyword)
         
-        # Set up session with headers
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        
-        # Make request to Google News RSS
-        response = session.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        # Parse RSS feed
-        feed = feedparser.parse(response.content)
-        
-        if not feed.entries:
-            return pd.DataFrame()
-        
-        # Extract article data
-        articles_data = []
-        
-        for entry in feed.entries:
-            try:
-                # Extract basic information
-                title = entry.get('title', '')
-                summary = entry.get('summary', '')
-                published = entry.get('published', '')
-                link = entry.get('link', '')
-                
-                # Extract source - try multiple possible locations
-                source = 'Unknown'
-                if hasattr(entry, 'source') and entry.source:
-                    if hasattr(entry.source, 'text'):
-                        source = entry.source.text
-                    elif isinstance(entry.source, str):
-                        source = entry.source
-                elif 'source' in entry:
-                    if isinstance(entry.source, dict) and 'text' in entry.source:
-                        source = entry.source['text']
-                    elif isinstance(entry.source, str):
-                        source = entry.source
-                
-                # Fallback: extract from link domain
-                if source == 'Unknown' and link:
-                    try:
-                        from urllib.parse import urlparse
-                        parsed_url = urlparse(link)
-                        source = parsed_url.netloc
-                    except:
-                        pass
-                
-                # Clean HTML tags from summary
-                summary = re.sub(r'<[^>]+>', '', summary)
-                
-                # Parse published date
-                try:
-                    if published:
-                        pub_date = datetime.strptime(published, '%a, %d %b %Y %H:%M:%S %Z')
-                    else:
-                        pub_date = datetime.now()
-                except:
-                    pub_date = datetime.now()
-                
-                # Combine title and summary for comprehensive sentiment analysis
-                # Use both title and summary for better accuracy
-                text_content = f"{title}. {summary}" if summary else title
-                
-                # Perform sentiment analysis
-                sentiment_results = perform_sentiment_analysis(text_content)
-                
-                # Create article record
-                article = {
-                    'title': title,
-                    'summary': summary,
-                    'date': pub_date,
-                    'url': link,
-                    'source': source,
-                    'textblob_sentiment': sentiment_results['textblob_sentiment'],
-                    'textblob_polarity': sentiment_results['textblob_polarity'],
-                    'textblob_subjectivity': sentiment_results['textblob_subjectivity'],
-                    'vader_sentiment': sentiment_results['vader_sentiment'],
-                    'vader_compound': sentiment_results['vader_compound'],
-                    'vader_positive': sentiment_results['vader_positive'],
-                    'vader_negative': sentiment_results['vader_negative'],
-                    'vader_neutral': sentiment_results['vader_neutral'],
-                    'action_urgency': sentiment_results['action_urgency']
-                }
-                
-                articles_data.append(article)
-                
-            except Exception as e:
-                print(f"Error processing article: {e}")
-                continue
+        if len(keywords) == 1:
+            frames = [_fetch_keyword_feed(keywords[0])]
+        else:
+            # Fetch all feeds concurrently so latency is bounded by the slowest one
+            with ThreadPoolExecutor(max_workers=min(8, len(keywords))) as executor:
+                frames = list(executor.map(_fetch_keyword_feed, keywords))
         
-        # Create DataFrame
-        df = pd.DataFrame(articles_data)
+        df = pd.concat(frames, ignore_index=True)
         
-        # Sort by date (newest first)
+        # Sort by date (newest first) with a single argsort on the int64 timestamps
         if not df.empty:
-            df = df.sort_values('date', ascending=False).reset_index(drop=True)
+            order = np.argsort(-df['date'].values.view('i8'), kind='stable')
+            df = df.take(order).reset_index(drop=True)
         
         return df
         
     except Exception as e:
-        print(f"Error analyzing feed: {e}")
+        logger.warning("Error analyzing feed: %s", e)
+        return pd.DataFrame()
+
+def _fetch_keyword_feed(keyword: str) -> pd.DataFrame:
+    """Analyze one keyword's feed, returning an empty frame on failure so other keywords survive."""
+    try:
+        return _analyze_keyword_feed(keyword)
+    except Exception as e:
+        logger.warning("Error analyzing feed for %r: %s", keyword, e)
         return pd.DataFrame()
 
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def _analyze_keyword_feed(keyword: str) -> pd.DataFrame:
+    """Download the Google News RSS feed for a single keyword and analyze its items."""
+    # Construct Google News RSS URL
+    base_url = "https://news.google.com/rss/search"
+    params = {
+        'q': keyword,
+        'hl': 'en',
+        'gl': 'US',
+        'ceid': 'US:en'
+    }
+    
+    # Make request to Google News RSS, streaming the body into the parser.
+    # The context manager returns the connection to the pool even if parsing fails.
+    with _get_session().get(base_url, params=params, timeout=(5, 30), stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        
+        # A live response cannot be re-read by a fallback parser, so recover in place
+        return analyze_rss_items([response.raw], recover=True)
+
 def analyze_uploaded_file(uploaded_file) -> pd.DataFrame:
     """
     Analyze sentiment from uploaded file (CSV, JSON, XML, RSS).
@@ -143,23 +131,40 @@ def analyze_uploaded_file(uploaded_file) -> pd.DataFrame:
     Args:
         uploaded_file: Streamlit uploaded file object
         
+    Returns:
+        pd.DataFrame: DataFrame with sentiment analysis results
+    """
+    return analyze_uploaded_bytes(uploaded_file.getvalue(), uploaded_file.name)
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def analyze_uploaded_bytes(content: bytes, filename: str) -> pd.DataFrame:
+    """
+    Analyze sentiment from the contents of an uploaded file (CSV, JSON, XML, RSS).
+    
+    Results are cached on the file contents, so re-analyzing the same
+    upload skips parsing and sentiment analysis.
+    
+    Args:
+        content (bytes): Raw file contents
+        filename (str): Original file name, used to detect the file type
+        
     Returns:
         pd.DataFrame: DataFrame with sentiment analysis results
     """
     try:
-        file_type = uploaded_file.name.split('.')[-1].lower()
+        file_type = filename.split('.')[-1].lower()
         
         if file_type == 'csv':
-            return analyze_csv_file(uploaded_file)
+            return analyze_csv_file(io.BytesIO(content))
         elif file_type == 'json':
-            return analyze_json_file(uploaded_file)
+            return analyze_json_file(io.BytesIO(content))
         elif file_type in ['xml', 'rss']:
-            return analyze_xml_rss_file(uploaded_file)
+            return analyze_xml_rss_file(io.BytesIO(content))
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
             
     except Exception as e:
-        print(f"Error analyzing uploaded file: {e}")
+        logger.warning("Error analyzing uploaded file: %s", e)
         return pd.DataFrame()
 
 def analyze_csv_file(uploaded_file) -> pd.DataFrame:
@@ -172,51 +177,10 @@ def analyze_csv_file(uploaded_file) -> pd.DataFrame:
         if not all(col in df.columns for col in required_columns):
             raise ValueError("CSV must contain 'title' column")
         
-        # Process each row
-        results = []
-        for _, row in df.iterrows():
-            try:
-                title = str(row.get('title', ''))
-                summary = str(row.get('summary', ''))
-                published = row.get('published', '')
-                url = row.get('url', '')
-                source = row.get('source', 'Unknown')
-                
-                # Parse date
-                try:
-                    if published:
-                        pub_date = pd.to_datetime(published)
-                    else:
-                        pub_date = datetime.now()
-                except:
-                    pub_date = datetime.now()
-                
-                # Combine text for analysis
-                text_content = f"{title}. {summary}"
-                
-                # Perform sentiment analysis
-                sentiment_results = perform_sentiment_analysis(text_content)
-                
-                # Create record
-                result = {
-                    'title': title,
-                    'summary': summary,
-                    'date': pub_date,
-                    'url': url,
-                    'source': source,
-                    **sentiment_results
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                print(f"Error processing row: {e}")
-                continue
-        
-        return pd.DataFrame(results)
+        return _analyze_frame(df)
         
     except Exception as e:
-        print(f"Error analyzing CSV file: {e}")
+        logger.warning("Error analyzing CSV file: %s", e)
         return pd.DataFrame()
 
 def analyze_json_file(uploaded_file) -> pd.DataFrame:
@@ -231,50 +195,15 @@ def analyze_json_file(uploaded_file) -> pd.DataFrame:
         if isinstance(data, dict):
             data = [data]
         
-        results = []
-        for item in data:
-            try:
-                title = str(item.get('title', ''))
-                summary = str(item.get('summary', ''))
-                published = item.get('published', '')
-                url = item.get('url', '')
-                source = item.get('source', 'Unknown')
-                
-                # Parse date
-                try:
-                    if published:
-                        pub_date = pd.to_datetime(published)
-                    else:
-                        pub_date = datetime.now()
-                except:
-                    pub_date = datetime.now()
-                
-                # Combine text for analysis
-                text_content = f"{title}. {summary}"
-                
-                # Perform sentiment analysis
-                sentiment_results = perform_sentiment_analysis(text_content)
-                
-                # Create record
-                result = {
-                    'title': title,
-                    'summary': summary,
-                    'date': pub_date,
-                    'url': url,
-                    'source': source,
-                    **sentiment_results
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                print(f"Error processing JSON item: {e}")
-                continue
+        # Skip records that are not JSON objects
+        records = [record for record in data if isinstance(record, dict)]
+        if not records:
+            return pd.DataFrame()
         
-        return pd.DataFrame(results)
+        return _analyze_frame(pd.DataFrame(records))
         
     except Exception as e:
-        print(f"Error analyzing JSON file: {e}")
+        logger.warning("Error analyzing JSON file: %s", e)
         return pd.DataFrame()
 
 def analyze_xml_rss_file(uploaded_file) -> pd.DataFrame:
@@ -282,8 +211,18 @@ def analyze_xml_rss_file(uploaded_file) -> pd.DataFrame:
     try:
         content = uploaded_file.read()
         
-        # Try parsing as RSS first
+        # Try streaming RSS items with lxml first
         try:
+            df = analyze_rss_items([content])
+            if not df.empty:
+                return df
+        except Exception:
+            pass
+        
+        # Fall back to feedparser for Atom and other feed dialects
+        try:
+            import feedparser
+            
             feed = feedparser.parse(content)
             if feed.entries:
                 return analyze_rss_entries(feed.entries)
@@ -300,12 +239,99 @@ def analyze_xml_rss_file(uploaded_file) -> pd.DataFrame:
         raise ValueError("Could not parse XML/RSS content")
         
     except Exception as e:
-        print(f"Error analyzing XML/RSS file: {e}")
+        logger.warning("Error analyzing XML/RSS file: %s", e)
         return pd.DataFrame()
 
+def _iter_rss_items(source, recover=False):
+    """Stream (title, summary, published, link, source) tuples from RSS <item> elements."""
+    from lxml import etree
+    
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    
+    for _, item in etree.iterparse(source, tag='item', recover=recover):
+        source_elem = item.find('source')
+        
+        yield (
+            item.findtext('title', ''),
+            item.findtext('summary') or item.findtext('description', ''),
+            item.findtext('pubDate', ''),
+            item.findtext('link', ''),
+            (source_elem.text or '') if source_elem is not None else ''
+        )
+        
+        # Release the parsed item and any earlier siblings so memory stays flat on large feeds
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+def _parse_rss_dates(publisheds) -> pd.Series:
+    """Parse RSS publication dates in one vectorized pass, defaulting to now."""
+    dates = pd.to_datetime(
+        pd.Series(publisheds, dtype=object),
+        format=RSS_DATE_FORMAT,
+        errors='coerce',
+        utc=True
+    )
+    return dates.fillna(pd.Timestamp.now(tz='UTC'))
+
+def analyze_rss_items(contents, recover=False) -> pd.DataFrame:
+    """
+    Analyze the <item> elements of one or more RSS documents (bytes or file objects).
+    
+    Malformed XML raises unless recover is set, in which case lxml skips what it cannot parse.
+    """
+    titles, summaries, publisheds, urls, sources = [], [], [], [], []
+    
+    for content in contents:
+        for title, summary, published, link, source in _iter_rss_items(content, recover):
+            try:
+                # Fallback: extract source from link domain
+                source = source or _domain(link) or 'Unknown'
+                
+                # Clean HTML tags and entities from summary
+                summary = _clean_summary(summary)
+                
+                titles.append(title)
+                summaries.append(summary)
+                publisheds.append(published)
+                urls.append(link)
+                sources.append(source)
+                
+            except Exception as e:
+                logger.debug("Error processing RSS item: %s", e)
+                continue
+    
+    return _build_results(titles, summaries, _parse_rss_dates(publisheds), urls, sources)
+
+def _clean_summary(summary: str) -> str:
+    """Strip HTML tags and decode entities so every feed path scores the same text."""
+    return html.unescape(_HTML_TAG_RE.sub('', summary)).strip()
+
+@lru_cache(maxsize=4096)
+def _domain(link: str) -> str:
+    """Return the host of a link, memoized since feeds repeat links across runs."""
+    try:
+        return urlparse(link).netloc
+    except ValueError:
+        return ''
+
+def _extract_source(entry) -> str:
+    """Resolve the publisher of a feedparser entry, falling back to its link domain."""
+    source = entry.get('source')
+    
+    if isinstance(source, dict):
+        name = source.get('title') or source.get('text')
+    elif isinstance(source, str):
+        name = source
+    else:
+        name = None
+    
+    return name or _domain(entry.get('link', '')) or 'Unknown'
+
 def analyze_rss_entries(entries) -> pd.DataFrame:
     """Analyze RSS feed entries."""
-    results = []
+    titles, summaries, publisheds, urls, sources = [], [], [], [], []
     
     for entry in entries:
         try:
@@ -313,106 +339,45 @@ def analyze_rss_entries(entries) -> pd.DataFrame:
             summary = entry.get('summary', '')
             published = entry.get('published', '')
             link = entry.get('link', '')
+            source = _extract_source(entry)
             
-            # Extract source - try multiple possible locations
-            source = 'Unknown'
-            if hasattr(entry, 'source') and entry.source:
-                if hasattr(entry.source, 'text'):
-                    source = entry.source.text
-                elif isinstance(entry.source, str):
-                    source = entry.source
-            elif 'source' in entry:
-                if isinstance(entry.source, dict) and 'text' in entry.source:
-                    source = entry.source['text']
-                elif isinstance(entry.source, str):
-                    source = entry.source
+            # Clean HTML tags and entities from summary
+            summary = _clean_summary(summary)
             
-            # Fallback: extract from link domain
-            if source == 'Unknown' and link:
-                try:
-                    from urllib.parse import urlparse
-                    parsed_url = urlparse(link)
-                    source = parsed_url.netloc
-                except:
-                    pass
-            
-            # Clean HTML tags from summary
-            summary = re.sub(r'<[^>]+>', '', summary)
-            
-            # Parse published date
-            try:
-                if published:
-                    pub_date = datetime.strptime(published, '%a, %d %b %Y %H:%M:%S %Z')
-                else:
-                    pub_date = datetime.now()
-            except:
-                pub_date = datetime.now()
-            
-            # Combine title and summary for comprehensive sentiment analysis
-            # Use both title and summary for better accuracy
-            text_content = f"{title}. {summary}" if summary else title
-            
-            # Perform sentiment analysis
-            sentiment_results = perform_sentiment_analysis(text_content)
-            
-            # Create record
-            result = {
-                'title': title,
-                'summary': summary,
-                'date': pub_date,
-                'url': link,
-                'source': source,
-                **sentiment_results
-            }
-            
-            results.append(result)
+            titles.append(title)
+            summaries.append(summary)
+            publisheds.append(published)
+            urls.append(link)
+            sources.append(source)
             
         except Exception as e:
-            print(f"Error processing RSS entry: {e}")
+            logger.debug("Error processing RSS entry: %s", e)
             continue
     
-    return pd.DataFrame(results)
+    return _build_results(titles, summaries, _parse_rss_dates(publisheds), urls, sources)
 
 def analyze_xml_elements(root) -> pd.DataFrame:
     """Analyze generic XML elements."""
-    results = []
+    titles, summaries, dates, urls, sources = [], [], [], [], []
     
     # Look for common XML structures
     items = root.findall('.//item') or root.findall('.//entry')
     
     for item in items:
         try:
-            title = ''
-            summary = ''
-            published = ''
-            link = ''
-            source = 'Unknown'
-            
-            # Extract title
-            title_elem = item.find('title')
-            if title_elem is not None:
-                title = title_elem.text or ''
-            
-            # Extract summary/description (try summary tag first, then description)
-            summary_elem = item.find('summary') or item.find('description')
-            if summary_elem is not None:
-                summary = summary_elem.text or ''
-                summary = re.sub(r'<[^>]+>', '', summary)
-            
-            # Extract published date
-            date_elem = item.find('pubDate') or item.find('published')
-            if date_elem is not None:
-                published = date_elem.text or ''
+            # Collect every field in a single pass over the item's children
+            fields = {}
+            for child in item:
+                if child.tag in _XML_ITEM_TAGS and child.tag not in fields:
+                    fields[child.tag] = child.text or ''
             
-            # Extract link
-            link_elem = item.find('link')
-            if link_elem is not None:
-                link = link_elem.text or ''
+            title = fields.get('title', '')
             
-            # Extract source
-            source_elem = item.find('source')
-            if source_elem is not None:
-                source = source_elem.text or 'Unknown'
+            # Prefer summary over description, and pubDate over published
+            summary = _clean_summary(fields.get('summary') or fields.get('description', ''))
+            published = fields.get('pubDate') or fields.get('published', '')
+            link = fields.get('link', '')
+            source = fields.get('source') or 'Unknown'
             
             # Parse date
             try:
@@ -423,99 +388,158 @@ def analyze_xml_elements(root) -> pd.DataFrame:
             except:
                 pub_date = datetime.now()
             
-            # Combine text for analysis
-            text_content = f"{title}. {summary}"
-            
-            # Perform sentiment analysis
-            sentiment_results = perform_sentiment_analysis(text_content)
-            
-            # Create record
-            result = {
-                'title': title,
-                'summary': summary,
-                'date': pub_date,
-                'url': link,
-                'source': source,
-                **sentiment_results
-            }
-            
-            results.append(result)
+            titles.append(title)
+            summaries.append(summary)
+            dates.append(pub_date)
+            urls.append(link)
+            sources.append(source)
             
         except Exception as e:
-            print(f"Error processing XML item: {e}")
+            logger.debug("Error processing XML item: %s", e)
             continue
     
-    return pd.DataFrame(results)
+    return _build_results(titles, summaries, dates, urls, sources)
 
-def perform_sentiment_analysis(text: str) -> dict:
+def _build_results(titles, summaries, dates, urls, sources) -> pd.DataFrame:
+    """Run batched sentiment analysis and assemble the results DataFrame."""
+    articles = pd.DataFrame({
+        'title': pd.array(titles, dtype='string'),
+        'summary': pd.array(summaries, dtype='string'),
+        'date': pd.to_datetime(dates, utc=True),
+        'url': pd.array(urls, dtype='string'),
+        'source': pd.array(sources, dtype='string')
+    })
+    
+    return _attach_sentiment(articles)
+
+def _analyze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Analyze sentiment for a DataFrame of articles using column operations."""
+    missing = pd.Series('', index=df.index)
+    
+    articles = pd.DataFrame({
+        'title': df.get('title', missing).fillna('').astype('string'),
+        'summary': df.get('summary', missing).fillna('').astype('string'),
+        'date': pd.to_datetime(
+            df.get('published', missing), errors='coerce', format='mixed', utc=True
+        ).fillna(pd.Timestamp.now(tz='UTC')),
+        'url': df.get('url', missing).fillna('').astype('string'),
+        'source': df.get('source', missing).fillna('').astype('string').replace('', 'Unknown')
+    })
+    
+    return _attach_sentiment(articles)
+
+def _attach_sentiment(articles: pd.DataFrame) -> pd.DataFrame:
+    """Append sentiment columns to a DataFrame of articles."""
+    # Combine title and summary for comprehensive sentiment analysis
+    titles = articles['title']
+    summaries = articles['summary']
+    texts = titles.str.cat(summaries, sep='. ').where(summaries != '', titles)
+    
+    sentiment_df = perform_sentiment_analysis_batch(texts.tolist()).set_axis(articles.index)
+    
+    return pd.concat([articles, sentiment_df], axis=1)
+
+@lru_cache(maxsize=8192)
+def _sentiment_scores(text: str) -> tuple:
     """
-    Perform sentiment analysis using TextBlob and VADER.
+    Return raw (polarity, subjectivity, compound, pos, neg, neu) scores for a text.
     
-    Args:
-        text (str): Text to analyze
-        
-    Returns:
-        dict: Sentiment analysis results
+    Memoized on the text itself, so articles syndicated across several
+    outlets are only scored once.
     """
     try:
-        # TextBlob analysis
-        blob = TextBlob(text)
-        textblob_polarity = blob.sentiment.polarity
-        textblob_subjectivity = blob.sentiment.subjectivity
-        
-        # Classify TextBlob sentiment
-        if textblob_polarity > 0.1:
-            textblob_sentiment = 'Positive'
-        elif textblob_polarity < -0.1:
-            textblob_sentiment = 'Negative'
+        # TextBlob is the expensive call and only noise on very short fragments
+        if len(text) < MIN_TEXTBLOB_LENGTH:
+            polarity, subjectivity = 0.0, 0.0
         else:
-            textblob_sentiment = 'Neutral'
+            from textblob import TextBlob
+            
+            polarity, subjectivity = TextBlob(text).sentiment
         
-        # VADER analysis
-        vader_scores = vader_analyzer.polarity_scores(text)
-        vader_compound = vader_scores['compound']
-        vader_positive = vader_scores['pos']
-        vader_negative = vader_scores['neg']
-        vader_neutral = vader_scores['neu']
+        vader_scores = get_vader().polarity_scores(text)
         
-        # Classify VADER sentiment
-        if vader_compound >= 0.05:
-            vader_sentiment = 'Positive'
-        elif vader_compound <= -0.05:
-            vader_sentiment = 'Negative'
-        else:
-            vader_sentiment = 'Neutral'
+        return (
+            polarity,
+            subjectivity,
+            vader_scores['compound'],
+            vader_scores['pos'],
+            vader_scores['neg'],
+            vader_scores['neu']
+        )
         
-        # Determine action urgency
-        if textblob_sentiment == 'Negative' and vader_sentiment == 'Negative':
-            action_urgency = 'High'
-        elif textblob_sentiment == 'Positive' and vader_sentiment == 'Positive':
-            action_urgency = 'Low'
-        else:
-            action_urgency = 'Medium'
+    except Exception as e:
+        logger.debug("Error in sentiment analysis: %s", e)
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+def _classify(polarity: np.ndarray, compound: np.ndarray) -> tuple:
+    """
+    Classify arrays of scores into int8 codes.
+    
+    Returns TextBlob and VADER codes (-1 negative, 0 neutral, 1 positive)
+    and action urgency codes (0 low, 1 medium, 2 high).
+    """
+    textblob_codes = (polarity > 0.1).astype(np.int8) - (polarity < -0.1)
+    vader_codes = (compound >= 0.05).astype(np.int8) - (compound <= -0.05)
+    
+    # High when both models agree on negative, Low when both agree on positive
+    both_negative = (textblob_codes < 0) & (vader_codes < 0)
+    both_positive = (textblob_codes > 0) & (vader_codes > 0)
+    urgency_codes = np.int8(1) + both_negative - both_positive
+    
+    return textblob_codes, vader_codes, urgency_codes.astype(np.int8)
+
+def perform_sentiment_analysis_batch(texts) -> pd.DataFrame:
+    """
+    Perform sentiment analysis on a batch of texts using TextBlob and VADER.
+    
+    Args:
+        texts (list): Texts to analyze
         
-        return {
-            'textblob_sentiment': textblob_sentiment,
-            'textblob_polarity': textblob_polarity,
-            'textblob_subjectivity': textblob_subjectivity,
-            'vader_sentiment': vader_sentiment,
-            'vader_compound': vader_compound,
-            'vader_positive': vader_positive,
-            'vader_negative': vader_negative,
-            'vader_neutral': vader_neutral,
-            'action_urgency': action_urgency
-        }
+    Returns:
+        pd.DataFrame: Sentiment analysis results, one row per text
+    """
+    scores = np.array([_sentiment_scores(text) for text in texts], dtype=np.float64).reshape(-1, 6)
+    
+    textblob_codes, vader_codes, urgency_codes = _classify(scores[:, 0], scores[:, 2])
+    
+    # Classification above runs on float64; scores are stored as float32
+    scores = scores.astype(np.float32)
+    
+    return pd.DataFrame({
+        'textblob_sentiment': pd.array(_SENTIMENT_LABELS[textblob_codes + 1], dtype='string'),
+        'textblob_polarity': scores[:, 0],
+        'textblob_subjectivity': scores[:, 1],
+        'vader_sentiment': pd.array(_SENTIMENT_LABELS[vader_codes + 1], dtype='string'),
+        'vader_compound': scores[:, 2],
+        'vader_positive': scores[:, 3],
+        'vader_negative': scores[:, 4],
+        'vader_neutral': scores[:, 5],
+        'action_urgency': pd.array(_URGENCY_LABELS[urgency_codes], dtype='string')
+    })
+
+def perform_sentiment_analysis(text: str) -> dict:
+    """
+    Perform sentiment analysis using TextBlob and VADER.
+    
+    Args:
+        text (str): Text to analyze
         
-    except Exception as e:
-        print(f"Error in sentiment analysis: {e}")
-        return {
-            'textblob_sentiment': 'Neutral',
-            'textblob_polarity': 0.0,
-            'textblob_subjectivity': 0.0,
-            'vader_sentiment': 'Neutral',
-            'vader_compound': 0.0,
-            'vader_positive': 0.0,
-            'vader_negative': 0.0,
-            'vader_neutral': 1.0,
-            'action_urgency': 'Medium'
-        }
+    Returns:
+        dict: Sentiment analysis results
+    """
+    # Built from the raw float64 scores rather than the batch frame, whose
+    # float32 storage dtype would otherwise leak into the returned values
+    polarity, subjectivity, compound, positive, negative, neutral = _sentiment_scores(text)
+    textblob_codes, vader_codes, urgency_codes = _classify(np.array([polarity]), np.array([compound]))
+    
+    return {
+        'textblob_sentiment': str(_SENTIMENT_LABELS[textblob_codes[0] + 1]),
+        'textblob_polarity': polarity,
+        'textblob_subjectivity': subjectivity,
+        'vader_sentiment': str(_SENTIMENT_LABELS[vader_codes[0] + 1]),
+        'vader_compound': compound,
+        'vader_positive': positive,
+        'vader_negative': negative,
+        'vader_neutral': neutral,
+        'action_urgency': str(_URGENCY_LABELS[urgency_codes[0]])
+    }
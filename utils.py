@@ -1,8 +1,62 @@
 import pandas as pd
-import json
-import xml.etree.ElementTree as ET
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from lxml import etree
+try:
+    import feedparser
+except ImportError:
+    feedparser = None
 from datetime import datetime
+from functools import lru_cache
+import html
+import io
+import json
+import logging
 import re
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Fields extracted for every article, in output order
+ARTICLE_COLUMNS = ['title', 'summary', 'published', 'url', 'source']
+
+# Rows read per chunk when parsing CSV uploads
+CSV_CHUNK_SIZE = 100_000
+
+# Conditional-GET state per feed URL: (etag, modified, articles)
+_feed_cache = {}
+
+# Child tags read from generic XML <item>/<entry> elements
+_XML_ITEM_TAGS = frozenset({'title', 'summary', 'description', 'pubDate', 'published', 'link', 'source'})
+
+# Generic XML article elements, compiled once
+_ITEM_XPATH = etree.XPath('.//item | .//entry')
+
+# Byte order mark some editors prepend to UTF-8 files
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# Bytes peeked from an upload to detect its format
+SNIFF_SIZE = 64
+
+# Date formats tried, in order, by format_date
+DATE_FORMATS = (
+    '%a, %d %b %Y %H:%M:%S %Z',  # RSS format
+    '%Y-%m-%d %H:%M:%S',         # Standard format
+    '%Y-%m-%d',                  # Date only
+    '%m/%d/%Y',                  # US format
+    '%d/%m/%Y',                  # EU format
+)
+
+# Pattern for stripping HTML tags
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Runs of tags and whitespace; group 1 is set when the run holds any whitespace
+_CLEAN_RE = re.compile(r'(?:<[^>]+>|(\s))+')
+
+# Host part of an http(s) URL, used as the fallback article source
+_NETLOC_RE = re.compile(r'https?://([^/?#]+)')
 
 def parse_uploaded_file(file):
     """
@@ -15,97 +69,201 @@ def parse_uploaded_file(file):
         list: List of article dictionaries
     """
     try:
-        file_type = file.name.split('.')[-1].lower()
+        file_type = _sniff_file_type(file)
         
-        if file_type == 'csv':
-            return parse_csv_file(file)
-        elif file_type == 'json':
+        if file_type == 'json':
             return parse_json_file(file)
-        elif file_type in ['xml', 'rss']:
+        elif file_type == 'xml':
             return parse_xml_rss_file(file)
         else:
-            raise ValueError(f"Unsupported file type: {file_type}")
+            return parse_csv_file(file)
             
     except Exception as e:
-        print(f"Error parsing file: {e}")
+        logger.warning("Error parsing file: %s", e)
         return []
 
+def _sniff_file_type(file):
+    """Classify an upload as 'json', 'xml' or 'csv' from its first bytes, leaving the position unchanged."""
+    start = file.tell()
+    head = file.read(SNIFF_SIZE)
+    file.seek(start)
+    
+    if isinstance(head, str):
+        head = head.encode()
+    first = head.removeprefix(_UTF8_BOM).lstrip()[:1]
+    
+    if first in (b'{', b'['):
+        return 'json'
+    if first == b'<':
+        return 'xml'
+    return 'csv'
+
+def _read_bytes(file):
+    """Return an upload's content, using the in-memory buffer when it has one."""
+    return file.getvalue() if hasattr(file, 'getvalue') else file.read()
+
 def parse_csv_file(file):
     """Parse CSV file."""
     try:
-        df = pd.read_csv(file)
         articles = []
         
-        for _, row in df.iterrows():
-            article = {
-                'title': str(row.get('title', '')),
-                'summary': str(row.get('summary', '')),
-                'published': str(row.get('published', '')),
-                'url': str(row.get('url', '')),
-                'source': str(row.get('source', 'Unknown'))
-            }
-            articles.append(article)
+        # Read only the article columns, keeping every value as a string, in
+        # bounded chunks so large uploads never sit in memory all at once
+        with pd.read_csv(
+            file,
+            usecols=lambda column: column in ARTICLE_COLUMNS,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=CSV_CHUNK_SIZE
+        ) as reader:
+            for chunk in reader:
+                # Add any missing columns and default the source
+                chunk = chunk.reindex(columns=ARTICLE_COLUMNS, fill_value='')
+                chunk['source'] = chunk['source'].replace('', 'Unknown')
+                articles.extend(chunk.to_dict(orient='records'))
         
         return articles
         
     except Exception as e:
-        print(f"Error parsing CSV: {e}")
+        logger.warning("Error parsing CSV: %s", e)
         return []
 
 def parse_json_file(file):
     """Parse JSON file."""
     try:
-        content = file.read()
-        data = json.loads(content)
+        content = _read_bytes(file)
+        data = _loads_json(content)
         
         # Handle both list and single object
         if isinstance(data, dict):
             data = [data]
+        if not all(isinstance(record, dict) for record in data):
+            raise ValueError("JSON records must be objects")
         
-        articles = []
-        for item in data:
-            article = {
-                'title': str(item.get('title', '')),
-                'summary': str(item.get('summary', '')),
-                'published': str(item.get('published', '')),
-                'url': str(item.get('url', '')),
-                'source': str(item.get('source', 'Unknown'))
-            }
-            articles.append(article)
+        # Project onto the article columns and stringify in one pandas pass;
+        # object dtype keeps ints from being widened to floats by missing values
+        df = pd.DataFrame(data, dtype=object).reindex(columns=ARTICLE_COLUMNS, fill_value='')
+        df = df.fillna('').astype(str)
+        df['source'] = df['source'].replace('', 'Unknown')
         
-        return articles
+        return df.to_dict(orient='records')
         
     except Exception as e:
-        print(f"Error parsing JSON: {e}")
+        logger.warning("Error parsing JSON: %s", e)
         return []
 
+def _loads_json(content):
+    """Decode JSON with orjson when available, falling back to the more lenient stdlib parser."""
+    if isinstance(content, bytes):
+        content = content.removeprefix(_UTF8_BOM)
+    
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    
+    return json.loads(content)
+
 def parse_xml_rss_file(file):
     """Parse XML/RSS file."""
     try:
-        content = file.read()
+        content = _read_bytes(file)
         
         # Try parsing as RSS first
-        try:
-            import feedparser
-            feed = feedparser.parse(content)
-            if feed.entries:
-                return parse_rss_entries(feed.entries)
-        except:
-            pass
+        if feedparser is not None:
+            try:
+                feed = feedparser.parse(content)
+                if feed.entries:
+                    return parse_rss_entries(feed.entries)
+            except Exception as e:
+                logger.debug("feedparser could not parse XML/RSS: %s", e)
         
-        # Try parsing as XML
+        # Try streaming generic XML items
         try:
-            root = ET.fromstring(content)
-            return parse_xml_elements(root)
-        except:
-            pass
+            return parse_xml_stream(content)
+        except Exception as e:
+            logger.debug("Could not stream generic XML items: %s", e)
+        
+        return []
         
+    except Exception as e:
+        logger.warning("Error parsing XML/RSS: %s", e)
         return []
+
+def parse_uploaded_feed_url(url, etag=None, modified=None):
+    """
+    Fetch and parse a remote feed, skipping the parse when it is unchanged.
+    
+    Args:
+        url (str): Feed URL
+        etag (str): ETag to send; defaults to the one from the last fetch of url
+        modified (str): Last-Modified value to send; defaults likewise
+        
+    Returns:
+        list: List of article dictionaries
+    """
+    try:
+        if feedparser is None:
+            raise ImportError("feedparser is required to fetch feed URLs")
+        
+        cached = _feed_cache.get(url)
+        if cached is not None:
+            etag = etag or cached[0]
+            modified = modified or cached[1]
+        
+        feed = feedparser.parse(url, etag=etag, modified=modified)
+        
+        # 304 Not Modified: reuse the articles parsed last time, or refetch
+        # without validators if there is nothing cached to reuse
+        if feed.get('status') == 304:
+            if cached is not None:
+                return list(cached[2])
+            feed = feedparser.parse(url)
+        
+        articles = parse_rss_entries(feed.entries)
+        if articles:
+            _feed_cache[url] = (feed.get('etag'), feed.get('modified'), articles)
+        
+        return list(articles)
         
     except Exception as e:
-        print(f"Error parsing XML/RSS: {e}")
+        logger.warning("Error parsing feed URL: %s", e)
         return []
 
+def parse_xml_stream(content):
+    """Stream generic XML <item> elements, or <entry> elements when there are no items."""
+    return _stream_xml_items(content, 'item') or _stream_xml_items(content, 'entry')
+
+def _stream_xml_items(content, tag):
+    """Parse every <tag> element of an XML document in a single streaming pass."""
+    articles = []
+    
+    for _, item in etree.iterparse(
+        io.BytesIO(content),
+        events=('end',),
+        tag=tag,
+        resolve_entities=False,
+        huge_tree=False
+    ):
+        try:
+            articles.append(_parse_xml_item(item))
+            
+        except Exception as e:
+            logger.debug("Error processing XML item: %s", e)
+        
+        # A match nested inside another one still belongs to its enclosing
+        # element, which has not been parsed yet, so leave it in place
+        if next(item.iterancestors(tag), None) is not None:
+            continue
+        
+        # Free the processed item and any earlier siblings so memory stays flat
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    
+    return articles
+
 def parse_rss_entries(entries):
     """Parse RSS feed entries."""
     articles = []
@@ -117,30 +275,10 @@ def parse_rss_entries(entries):
             published = entry.get('published', '')
             link = entry.get('link', '')
             
-            # Extract source - try multiple possible locations
-            source = 'Unknown'
-            if hasattr(entry, 'source') and entry.source:
-                if hasattr(entry.source, 'text'):
-                    source = entry.source.text
-                elif isinstance(entry.source, str):
-                    source = entry.source
-            elif 'source' in entry:
-                if isinstance(entry.source, dict) and 'text' in entry.source:
-                    source = entry.source['text']
-                elif isinstance(entry.source, str):
-                    source = entry.source
-            
-            # Fallback: extract from link domain
-            if source == 'Unknown' and link:
-                try:
-                    from urllib.parse import urlparse
-                    parsed_url = urlparse(link)
-                    source = parsed_url.netloc
-                except:
-                    pass
+            source = _extract_source(entry)
             
-            # Clean HTML tags from summary
-            summary = re.sub(r'<[^>]+>', '', summary)
+            # Clean HTML tags and entities from summary
+            summary = _clean_summary(summary)
             
             article = {
                 'title': title,
@@ -152,67 +290,83 @@ def parse_rss_entries(entries):
             articles.append(article)
             
         except Exception as e:
-            print(f"Error processing RSS entry: {e}")
+            logger.debug("Error processing RSS entry: %s", e)
             continue
     
     return articles
 
+def _extract_source(entry):
+    """Resolve the publisher of a feedparser entry, falling back to its link domain."""
+    source = entry.get('source')
+    
+    if isinstance(source, dict):
+        name = source.get('title') or source.get('text')
+    elif isinstance(source, str):
+        name = source
+    else:
+        name = None
+    
+    if name:
+        return name
+    
+    # Fallback: extract from link domain
+    link = entry.get('link', '')
+    if not link:
+        return 'Unknown'
+    match = _NETLOC_RE.match(link)
+    if match:
+        return match.group(1)
+    try:
+        return urlparse(link).netloc
+    except ValueError:
+        return 'Unknown'
+
 def parse_xml_elements(root):
     """Parse generic XML elements."""
     articles = []
     
-    # Look for common XML structures
-    items = root.findall('.//item') or root.findall('.//entry')
+    # Look for common XML structures below root; non-lxml roots use findall
+    if etree.iselement(root):
+        nodes = _ITEM_XPATH(root)
+    else:
+        nodes = root.findall('.//item') + root.findall('.//entry')
+    
+    # Prefer <item> elements, using <entry> only when there are none
+    items = [node for node in nodes if node.tag == 'item'] or [node for node in nodes if node.tag == 'entry']
     
     for item in items:
         try:
-            title = ''
-            summary = ''
-            published = ''
-            link = ''
-            source = 'Unknown'
-            
-            # Extract title
-            title_elem = item.find('title')
-            if title_elem is not None:
-                title = title_elem.text or ''
-            
-            # Extract summary/description (try summary tag first, then description)
-            summary_elem = item.find('summary') or item.find('description')
-            if summary_elem is not None:
-                summary = summary_elem.text or ''
-                summary = re.sub(r'<[^>]+>', '', summary)
-            
-            # Extract published date
-            date_elem = item.find('pubDate') or item.find('published')
-            if date_elem is not None:
-                published = date_elem.text or ''
-            
-            # Extract link
-            link_elem = item.find('link')
-            if link_elem is not None:
-                link = link_elem.text or ''
-            
-            # Extract source
-            source_elem = item.find('source')
-            if source_elem is not None:
-                source = source_elem.text or 'Unknown'
-            
-            article = {
-                'title': title,
-                'summary': summary,
-                'published': published,
-                'url': link,
-                'source': source
-            }
-            articles.append(article)
+            articles.append(_parse_xml_item(item))
             
         except Exception as e:
-            print(f"Error processing XML item: {e}")
+            logger.debug("Error processing XML item: %s", e)
             continue
     
     return articles
 
+def _parse_xml_item(item):
+    """Extract article fields from a single XML <item>/<entry> element."""
+    # Collect every field in a single pass over the item's children
+    fields = {}
+    for child in item:
+        if child.tag in _XML_ITEM_TAGS and child.tag not in fields:
+            fields[child.tag] = child.text or ''
+    
+    # Prefer summary over description, and pubDate over published
+    summary = _clean_summary(fields.get('summary') or fields.get('description', ''))
+    
+    return {
+        'title': fields.get('title', ''),
+        'summary': summary,
+        'published': fields.get('pubDate') or fields.get('published', ''),
+        'url': fields.get('link', ''),
+        'source': fields.get('source') or 'Unknown'
+    }
+
+def _clean_summary(summary):
+    """Strip HTML tags and decode entities from a feed summary."""
+    return html.unescape(_TAG_RE.sub('', summary)).strip()
+
 def build_sentiment_summary(df: pd.DataFrame) -> dict:
     """
     Build sentiment summary statistics from DataFrame.
@@ -237,30 +391,27 @@ def build_sentiment_summary(df: pd.DataFrame) -> dict:
                 'neutral_pct': 0.0
             }
         
-        # Count sentiments (using TextBlob sentiment as primary)
-        sentiment_counts = df['textblob_sentiment'].value_counts()
-        
-        positive_count = sentiment_counts.get('Positive', 0)
-        negative_count = sentiment_counts.get('Negative', 0)
-        neutral_count = sentiment_counts.get('Neutral', 0)
+        # Count sentiments (using TextBlob sentiment as primary) in a single pass
+        counts = df['textblob_sentiment'].value_counts().reindex(
+            ['Positive', 'Negative', 'Neutral'], fill_value=0
+        )
+        positive_count, negative_count, neutral_count = (int(count) for count in counts.values)
         
         # Calculate percentages
-        positive_pct = (positive_count / total_count) * 100
-        negative_pct = (negative_count / total_count) * 100
-        neutral_pct = (neutral_count / total_count) * 100
+        scale = 100.0 / total_count
         
         return {
             'total_count': total_count,
             'positive_count': positive_count,
             'negative_count': negative_count,
             'neutral_count': neutral_count,
-            'positive_pct': positive_pct,
-            'negative_pct': negative_pct,
-            'neutral_pct': neutral_pct
+            'positive_pct': positive_count * scale,
+            'negative_pct': negative_count * scale,
+            'neutral_pct': neutral_count * scale
         }
         
     except Exception as e:
-        print(f"Error building sentiment summary: {e}")
+        logger.warning("Error building sentiment summary: %s", e)
         return {
             'total_count': 0,
             'positive_count': 0,
@@ -295,9 +446,30 @@ def make_clickable_link(title: str, url: str) -> str:
             return title
             
     except Exception as e:
-        print(f"Error creating clickable link: {e}")
+        logger.warning("Error creating clickable link: %s", e)
         return title
 
+def make_clickable_links(titles: pd.Series, urls: pd.Series) -> pd.Series:
+    """
+    Create clickable markdown links for whole columns at once.
+    
+    Args:
+        titles (pd.Series): Link texts
+        urls (pd.Series): Link URLs, aligned with titles
+        
+    Returns:
+        pd.Series: Markdown formatted links, or the bare title where the URL is blank
+    """
+    titles = titles.fillna('').astype(str)
+    urls = urls.fillna('').astype(str).str.strip()
+    has_url = urls.ne('')
+    
+    # Default the scheme the same way make_clickable_link does
+    urls = urls.where(urls.str.startswith(('http://', 'https://')), 'https://' + urls)
+    links = '[' + titles + '](' + urls + ')'
+    
+    return links.where(has_url, titles)
+
 def clean_text(text: str) -> str:
     """
     Clean text by removing HTML tags and extra whitespace.
@@ -309,22 +481,40 @@ def clean_text(text: str) -> str:
         str: Cleaned text
     """
     try:
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        # Remove HTML tags and collapse whitespace in a single pass
+        return _CLEAN_RE.sub(_clean_replacement, text).strip()
         
     except Exception as e:
-        print(f"Error cleaning text: {e}")
+        logger.warning("Error cleaning text: %s", e)
         return text
 
+def _clean_replacement(match):
+    """Collapse a tag/whitespace run to one space if it held whitespace, else drop it."""
+    return ' ' if match.group(1) else ''
+
+def validate_articles(articles):
+    """
+    Validate many articles at once.
+    
+    Args:
+        articles (pd.DataFrame | list): Articles as a DataFrame or list of dictionaries
+        
+    Returns:
+        pd.Series | list: Boolean mask, True where the article has a title
+    """
+    if isinstance(articles, pd.DataFrame):
+        if 'title' not in articles:
+            return pd.Series(False, index=articles.index)
+        return articles['title'].fillna('').astype(str).str.len().gt(0)
+    
+    return [bool(article.get('title')) for article in articles]
+
 def validate_article_data(article: dict) -> bool:
     """
     Validate article data structure.
     
+    Single-article fallback; prefer validate_articles for batches.
+    
     Args:
         article (dict): Article data dictionary
         
@@ -342,13 +532,15 @@ def validate_article_data(article: dict) -> bool:
         return True
         
     except Exception as e:
-        print(f"Error validating article data: {e}")
+        logger.warning("Error validating article data: %s", e)
         return False
 
 def format_date(date_str: str) -> datetime:
     """
     Format date string to datetime object.
     
+    Single-value fallback; prefer format_dates for whole columns.
+    
     Args:
         date_str (str): Date string
         
@@ -356,24 +548,38 @@ def format_date(date_str: str) -> datetime:
         datetime: Formatted datetime object
     """
     try:
-        # Try common date formats
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %Z',  # RSS format
-            '%Y-%m-%d %H:%M:%S',         # Standard format
-            '%Y-%m-%d',                  # Date only
-            '%m/%d/%Y',                  # US format
-            '%d/%m/%Y',                  # EU format
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        parsed = _parse_date(date_str)
+        if parsed is not None:
+            return parsed
         
-        # If no format works, try pandas
+        # If no format works, try pandas; not cached, since strings like
+        # 'now' or 'today' must be re-evaluated on every call
         return pd.to_datetime(date_str)
         
     except Exception as e:
-        print(f"Error formatting date: {e}")
+        logger.debug("Error formatting date: %s", e)
         return datetime.now()
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str):
+    """Parse a date string with the fixed DATE_FORMATS, memoized; None if none match."""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    return None
+
+def format_dates(series: pd.Series) -> pd.Series:
+    """
+    Format a Series of date strings to datetimes in one vectorized pass.
+    
+    Args:
+        series (pd.Series): Date strings
+        
+    Returns:
+        pd.Series: UTC datetimes, with unparseable values set to now
+    """
+    dates = pd.to_datetime(series, errors='coerce', format='mixed', utc=True)
+    return dates.fillna(pd.Timestamp.now(tz='UTC'))